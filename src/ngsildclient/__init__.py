@@ -11,6 +11,7 @@
 
 import http.client
 import logging
+import os
 import sys
 
 __version__ = "0.5.2"
@@ -55,21 +56,28 @@ __all__ = [
     "NgsiApiError",
     "NgsiContextBrokerError",
     "NgsiAlreadyExistsError",
+    "configure_logging",
 ]
 
-logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO)
 if is_interactive():
     logging.disable(logging.CRITICAL)
     sys.tracebacklimit = 0
 
 logger = logging.getLogger(__name__)
 
-http.client.HTTPConnection.debuglevel = 1
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure the root logger for applications that don't set up logging themselves."""
+    logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=level)
 
 
 def print_to_log(*args):
-    logger.debug(" ".join(args))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(" ".join(args))
 
 
-# monkey patch the http.client's print() function
-http.client.print = print_to_log
+# log the raw HTTP exchanges only when NGSILD_HTTP_DEBUG is set
+if os.environ.get("NGSILD_HTTP_DEBUG"):
+    http.client.HTTPConnection.debuglevel = 1
+    # monkey patch the http.client's print() function
+    http.client.print = print_to_log
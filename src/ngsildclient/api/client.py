@@ -27,7 +27,9 @@ if TYPE_CHECKING:
 
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from urllib3.util.retry import Retry
 from dataclasses import dataclass
 from math import ceil
 import networkx as nx
@@ -173,6 +175,21 @@ class Client:
         }
         if tenant is not None:
             self.session.headers["NGSILD-Tenant"] = tenant
+        # keep connections alive across calls and retry idempotent requests on gateway errors
+        # connection errors are not retried, so that an unreachable broker is reported at once
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                connect=0,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_FORCELIST,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         if proxy:
             self.session.proxies = {proxy}
 
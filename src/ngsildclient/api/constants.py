@@ -93,6 +93,12 @@ ENDPOINT_CSOURCE_REGISTRATIONS = f"{NGSILD_BASEPATH}/csourceRegistrations"
 ENDPOINT_TEMPORAL = f"temporal/entities"
 ENDPOINT_ALT_QUERY_TEMPORAL = "temporal/entityOperations/query"
 
+POOL_CONNECTIONS = 16  # number of connection pools to cache (one per host)
+POOL_MAXSIZE = 64  # maximum number of connections kept alive per host
+RETRY_TOTAL = 3  # retries on read errors and gateway errors
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_FORCELIST = (502, 503, 504)
+
 PAGINATION_LIMIT_MAX = 100  # pagination
 BATCHSIZE = 100  # maximum number of entities sent per batch operation
 
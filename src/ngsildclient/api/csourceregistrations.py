@@ -10,9 +10,10 @@
 # Author: Jorge LANZA <jlanza@tlmat.unican.es> et al.
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Sequence
-from functools import partialmethod
+from typing import TYPE_CHECKING, Any, Sequence
+from functools import partialmethod, lru_cache
 from hashlib import sha1
+from concurrent.futures import ThreadPoolExecutor
 
 import logging
 
@@ -20,7 +21,8 @@ import re
 import json
 
 from ..model.constants import CORE_CONTEXT
-from .exceptions import NgsiApiError
+from ..utils import is_orjson_installed
+from .exceptions import NgsiApiError, NgsiPartialRegistrationError
 
 if TYPE_CHECKING:
     from .client import Client
@@ -30,6 +32,104 @@ from ngsildclient.api.helper.csourceregistration import CSourceRegistration
 
 logger = logging.getLogger(__name__)
 
+if is_orjson_installed():
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # input orjson rejects but the json module accepts (e.g. integers beyond 64 bits)
+            return json.dumps(obj).encode("utf-8")
+
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# overrides session headers, never mutated
+_BASE_HEADERS = {
+    "Accept": "application/ld+json",
+    "Content-Type": None,
+}
+
+
+@lru_cache(maxsize=16)
+def _link_header(ctx: str) -> str:
+    return f'<{ctx}>; rel="{CORE_CONTEXT}"; type="application/ld+json"'
+
+
+_TIMEPROPERTY_VALID = frozenset(("observedAt", "createdAt", "modifiedAt", "deletedAt"))
+_TIMEREL_VALID = frozenset(("before", "after", "between"))
+
+# query() keyword arguments are named after the NGSI-LD query parameters they map to
+_QUERY_PARAMS = (
+    "type",
+    "idPattern",
+    "attrs",
+    "q",
+    "csf",
+    "geometry",
+    "georel",
+    "coordinates",
+    "geoproperty",
+    "timeproperty",
+    "timerel",
+    "timeAt",
+    "endTimeAt",
+    "geometryProperty",
+    "lang",
+    "scopeQ",
+)
+
+
+# tag of lists made only of strings (propertyNames, relationshipNames, entity types...)
+# kept flat so that they are hashed in one pass instead of item by item
+_STRLIST = "strlist"
+
+
+def _canon(obj: Any) -> tuple:
+    """Build a hashable canonical key from a JSON-like object.
+
+    Each node is a (tag, payload) pair so that dicts, lists and scalars never collide.
+    """
+    if isinstance(obj, dict):
+        return dict, tuple(sorted((k, _canon(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        if all(isinstance(v, str) for v in obj):
+            return _STRLIST, tuple(obj)
+        return list, tuple(_canon(v) for v in obj)
+    return type(obj), obj
+
+
+def _feed(h, key: tuple):
+    """Stream a canonical key into the hash object without building an intermediate string."""
+    tag, payload = key
+    if tag is dict:
+        h.update(b"{")
+        for k, v in payload:
+            h.update(repr(k).encode("utf-8"))
+            h.update(b":")
+            _feed(h, v)
+            h.update(b",")
+        h.update(b"}")
+    elif tag is list:
+        h.update(b"[")
+        for v in payload:
+            _feed(h, v)
+            h.update(b",")
+        h.update(b"]")
+    else:  # scalars and string lists, the latter fed by a single repr() of the whole tuple
+        h.update(repr(payload).encode("utf-8"))
+
+
+@lru_cache(maxsize=1024)
+def _hash_canon(key: tuple) -> bytes:
+    h = sha1()
+    _feed(h, key)
+    return h.digest()
+
 
 class CSourceRegistrations:
     """A wrapper for the NGSI-LD API subscriptions endpoint."""
@@ -45,12 +145,66 @@ class CSourceRegistrations:
     ) -> str:
         csourcereg_dict = csourcereg.to_dict()
         if raise_on_conflict:
-            conflicts = self.conflicts(csourcereg_dict)
-            if conflicts:
-                raise ValueError(
-                    f"A csource already exists with same target : {conflicts}"
-                )
-        r = self._session.post(f"{self.url}/", json=csourcereg_dict)
+            self._raise_on_conflicts(csourcereg_dict)
+        return self._post(csourcereg_dict)
+
+    @rfc7807_error_handle
+    def register_many(
+        self,
+        csourceregs: Sequence[CSourceRegistration],
+        raise_on_conflict: bool = True,
+        max_inflight: int = 16,
+    ) -> list[str]:
+        """Register several csources concurrently.
+
+        Up to max_inflight registrations are posted at the same time over the client's pooled session.
+
+        Returns
+        -------
+        list[str]
+            The ids returned by the broker, in the same order as csourceregs
+
+        Raises
+        ------
+        NgsiPartialRegistrationError
+            If some registrations failed, carrying the ids of the ones that were created
+        """
+        csourcereg_dicts = [csourcereg.to_dict() for csourcereg in csourceregs]
+        if raise_on_conflict:
+            # the broker cannot see conflicts between csources of the same batch
+            seen = set()
+            for csourcereg_dict in csourcereg_dicts:
+                h = self._hash(csourcereg_dict)
+                if h in seen:
+                    raise ValueError(
+                        f"A csource with same target is registered twice in the batch : {csourcereg_dict.get('id')}"
+                    )
+                seen.add(h)
+                self._raise_on_conflicts(csourcereg_dict)
+        with ThreadPoolExecutor(max_workers=max_inflight) as executor:
+            futures = [executor.submit(self._post, csourcereg_dict) for csourcereg_dict in csourcereg_dicts]
+        ids = []
+        errors = {}
+        for i, future in enumerate(futures):
+            try:
+                ids.append(future.result())
+            except Exception as e:
+                ids.append(None)
+                errors[i] = e
+        if errors:
+            raise NgsiPartialRegistrationError(ids, errors) from next(iter(errors.values()))
+        return ids
+
+    def _raise_on_conflicts(self, csourcereg_dict: dict):
+        conflicts = self.conflicts(csourcereg_dict)
+        if conflicts:
+            raise ValueError(
+                f"A csource already exists with same target : {conflicts}"
+            )
+
+    @rfc7807_error_handle
+    def _post(self, csourcereg_dict: dict) -> str:
+        r = self._session.post(f"{self.url}/", data=_dumps(csourcereg_dict))
         self._client.raise_for_status(r)
         location = r.headers.get("Location")
         if location is None:
@@ -97,63 +251,25 @@ class CSourceRegistrations:
                 "geometry and coordinates must be provided if georel is provided"
             )
 
-        params = {}
+        if timeproperty and timeproperty not in _TIMEPROPERTY_VALID:
+            raise ValueError(
+                "timeproperty must be one of observedAt, createdAt, modifiedAt or deletedAt"
+            )
+        if timerel and timerel not in _TIMEREL_VALID:
+            raise ValueError(
+                "timerel must be one of before, after or between"
+            )
+
+        args = locals()
+        params = {name: args[name] for name in _QUERY_PARAMS if args[name]}
         if isinstance(id, list) and len(id) > 0:
             params["id"] = ",".join(id)
-        if type:
-            params["type"] = type
-        if idPattern:
-            params["idPattern"] = idPattern
-        if attrs:
-            params["attrs"] = attrs
-        if q:
-            params["q"] = q
-        if csf:
-            params["csf"] = csf
-        if geometry:
-            params["geometry"] = geometry
-        if georel:
-            params["georel"] = georel
-        if coordinates:
-            params["coordinates"] = coordinates
-        if geoproperty:
-            params["geoproperty"] = geoproperty
-        if timeproperty:
-            if timeproperty not in [
-                "observedAt",
-                "createdAt",
-                "modifiedAt",
-                "deletedAt",
-            ]:
-                raise ValueError(
-                    "timeproperty must be one of observedAt, createdAt, modifiedAt or deletedAt"
-                )
-            params["timeproperty"] = timeproperty
-        if timerel:
-            if timerel not in ["before", "after", "between"]:
-                raise ValueError(
-                    "timerel must be one of before, after or between"
-                )
-            params["timerel"] = timerel
-        if timeAt:
-            params["timeAt"] = timeAt
-        if endTimeAt:
-            params["endTimeAt"] = endTimeAt
-        if geometryProperty:
-            params["geometryProperty"] = geometryProperty
-        if lang:
-            params["lang"] = lang
-        if scopeQ:
-            params["scopeQ"] = scopeQ
-
-        headers = {
-            "Accept": "application/ld+json",
-            "Content-Type": None,
-        }  # overrides session headers
-        if ctx is not None:
-            headers[
-                "Link"
-            ] = f'<{ctx}>; rel="{CORE_CONTEXT}"; type="application/ld+json"'
+
+        headers = (
+            _BASE_HEADERS
+            if ctx is None
+            else {**_BASE_HEADERS, "Link": _link_header(ctx)}
+        )
         r = self._session.get(f"{self.url}", params=params, headers=headers)
         self._client.raise_for_status(r)
         csourceregistrations = r.json()
@@ -175,36 +291,30 @@ class CSourceRegistrations:
         return params
 
     @staticmethod
-    def _hash(csource: dict):
+    def _hash(csource: dict) -> bytes:
         criteria = CSourceRegistrations._criteria_only(csource)
-        return sha1(
-            json.dumps(criteria, sort_keys=True).encode("utf-8")
-        ).digest()
+        return _hash_canon(_canon(criteria))
 
     # TODO: Analyse what to include in the hash and how to query
     @rfc7807_error_handle
     def conflicts(self, csource: dict, ctx: str = CORE_CONTEXT) -> list:
         return []
         # hashref = CSourceRegistrations._hash(csource)
-        # headers = {
-        #     "Accept": "application/ld+json",
-        #     "Content-Type": None,
-        # }  # overrides session headers
-        # if ctx is not None:
-        #     headers["Link"] = f'<{ctx}>; rel="{CORE_CONTEXT}"; type="application/ld+json"'
+        # headers = (
+        #     _BASE_HEADERS
+        #     if ctx is None
+        #     else {**_BASE_HEADERS, "Link": _link_header(ctx)}
+        # )
         # r = self.query()
         # return [x for x in r.json() if CSourceRegistrations._hash(x) == hashref]
 
     @rfc7807_error_handle
     def get(self, id: str, ctx: str = CORE_CONTEXT) -> dict:
-        headers = {
-            "Accept": "application/ld+json",
-            "Content-Type": None,
-        }  # overrides session headers
-        if ctx is not None:
-            headers[
-                "Link"
-            ] = f'<{ctx}>; rel="{CORE_CONTEXT}"; type="application/ld+json"'
+        headers = (
+            _BASE_HEADERS
+            if ctx is None
+            else {**_BASE_HEADERS, "Link": _link_header(ctx)}
+        )
         r = self._session.get(f"{self.url}/{id}", headers=headers)
         self._client.raise_for_status(r)
         return r.json()
@@ -56,6 +56,19 @@ class NgsiHttpError(NgsiApiError):
         super().__init__(self.message)
 
 
+class NgsiPartialRegistrationError(NgsiApiError):
+    """Raised when some registrations of a batch fail while others have been created.
+
+    ids holds the ids of the created registrations in the submitted order, None where it failed.
+    errors maps the index of each failed registration to its exception.
+    """
+
+    def __init__(self, ids: list, errors: dict):
+        self.ids = ids
+        self.errors = errors
+        super().__init__(f"{len(errors)} of {len(ids)} registrations failed : {list(errors.values())}")
+
+
 class NgsiContextBrokerError(NgsiApiError):
     def __init__(self, problemdetails: ProblemDetails):
         self.problemdetails = problemdetails
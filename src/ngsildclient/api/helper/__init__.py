@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+# Software Name: ngsildclient
+# SPDX-FileCopyrightText: Copyright (c) 2021 Orange UNICAN
+# SPDX-License-Identifier: Apache 2.0
+#
+# This software is distributed under the Apache 2.0;
+# see the NOTICE file for more details.
+#
+# Author: Fabien BATTELLO <fabien.battello@orange.com> et al.
+# Author: Jorge LANZA <jlanza@tlmat.unican.es> et al.
+
+from functools import wraps
+from typing import Callable, Union
+
+
+def expect(types: Union[type, tuple[type, ...]], msg: str) -> Callable:
+    """Decorate a builder setter so that it raises ValueError(msg) when the given value is not an instance of types."""
+
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def wrapper(self, value):
+            if not isinstance(value, types):
+                raise ValueError(msg)
+            return f(self, value)
+
+        return wrapper
+
+    return decorator
@@ -9,21 +9,21 @@
 #
 # Author: Jorge LANZA <jlanza@tlmat.unican.es> et al.
 
-import inspect
 from dataclasses import dataclass, fields
+from functools import lru_cache
 
 # pyhumps
 import humps
 
 from datetime import datetime, timedelta
-import isodate
-from ngsildclient.utils import iso8601, url
+from ngsildclient.utils import iso8601, url, DATACLASS_SLOTS
 
 import ngsildclient.utils.url as url
 from ngsildclient.model.constants import CORE_CONTEXT
+from ngsildclient.api.helper import expect
 
-from geojson import Point, LineString, Polygon, MultiPoint
-from geojson.geometry import Geometry
+# kept at module level: field annotations drive CSourceRegistration.from_dict()
+from geojson.geometry import Geometry, Point
 
 from typing import get_origin
 from typing import (
@@ -32,7 +32,6 @@ from typing import (
     Any,
     Union,
     List,
-    Tuple,
     Optional,
     Mapping,
     Callable,
@@ -41,6 +40,32 @@ from typing import (
 from enum import Enum, unique
 
 
+@lru_cache(maxsize=256)
+def _iso(dt: datetime) -> str:
+    # registrations often share the same expiration horizon
+    return iso8601.from_datetime(dt)
+
+
+# plain numbers take the Point fast path, bool (an int subclass) and anything else go through geojson
+_NUMBER_TYPES = frozenset((int, float))
+
+_MODE_VALID = frozenset(("inclusive", "exclusive", "redirect", "auxiliary"))
+
+
+def _coerce_geom(value: Union[tuple, Geometry], name: str) -> Union[dict, Geometry]:
+    if isinstance(value, tuple):
+        if len(value) != 2:
+            raise ValueError("lat, lon tuple expected")
+        lat, lon = value
+        if type(lat) in _NUMBER_TYPES and type(lon) in _NUMBER_TYPES:
+            # same payload as Point((lon, lat)) without going through geojson's validation
+            return {"type": "Point", "coordinates": [round(lon, 6), round(lat, 6)]}
+        return Point((lon, lat))
+    if isinstance(value, Geometry):
+        return value
+    raise ValueError(f"{name} shall be a tuple or Geometry")
+
+
 @unique
 class ImplementedOperation(Enum):
     # Context Information Provision
@@ -95,8 +120,7 @@ class OperationsGroup(Enum):
 
 
 class TimeInterval:
-    start_at: datetime = None
-    end_at: datetime = None
+    __slots__ = ("start_at", "end_at")
 
     def __init__(
         self,
@@ -108,25 +132,25 @@ class TimeInterval:
         ):
             raise ValueError("start_at and end_at shall be datetime")
 
-        self.start_at = iso8601.from_datetime(start_at)
-
-        if end_at:
-            self.end_at = iso8601.from_datetime(end_at)
+        self.start_at = _iso(start_at)
+        self.end_at = _iso(end_at) if end_at else None
 
     def to_dict(self) -> dict:
         d = {}
         d["startAt"] = self.start_at
-        if self.end_at:
+        if self.end_at is not None:
             d["endAt"] = self.end_at
         return d
 
 
 @dataclass
 class RegistrationManagementInfo:
-    local_only: bool = None
-    cache_duration: Union[str, datetime] = None
-    timeout: int = None
-    cooldown: int = None
+    __slots__ = ("local_only", "cache_duration", "timeout", "cooldown")
+
+    local_only: bool
+    cache_duration: Union[str, datetime]
+    timeout: int
+    cooldown: int
 
     def __init__(
         self,
@@ -135,29 +159,28 @@ class RegistrationManagementInfo:
         timeout: int = None,
         cooldown: int = None,
     ):
-        if local_only:
+        self.local_only = self.cache_duration = self.timeout = self.cooldown = None
+        if local_only is not None:
             self.local_only = local_only
-        if cache_duration:
+        if cache_duration is not None:
+            import isodate
+
             self.cache_duration = isodate.duration_isoformat(cache_duration)
-        if timeout:
-            if timeout < 0:
-                raise ValueError("timeout shall be greater than 0")
+        if timeout is not None:
             self.timeout = timeout
-        if cooldown:
-            if cooldown < 0:
-                raise ValueError("cooldown shall be greater than 0")
-            self.cooldonw = cooldown
+        if cooldown is not None:
+            self.cooldown = cooldown
 
     def to_dict(self) -> dict:
         d = {}
-        if self.local_only:
+        if self.local_only is not None:
             d["localOnly"] = self.local_only
-        if self.cache_duration:
+        if self.cache_duration is not None:
             d["cacheDuration"] = self.cache_duration
-        if self.timeout:
+        if self.timeout is not None:
             d["timeout"] = self.timeout
-        if self.cooldonw:
-            d["cooldown"] = self.cooldonw
+        if self.cooldown is not None:
+            d["cooldown"] = self.cooldown
         return d
 
     @classmethod
@@ -175,9 +198,11 @@ class RegistrationManagementInfo:
 class RegistrationInfo:
     @dataclass
     class EntityInfo:
-        id: str = None
-        id_pattern: str = None
-        type: Union[str, list[str]] = None
+        __slots__ = ("id", "id_pattern", "type")
+
+        id: str
+        id_pattern: str
+        type: Union[str, list[str]]
 
         def __init__(
             self,
@@ -186,10 +211,8 @@ class RegistrationInfo:
             id: str = None,
         ):
             self.type = type
-            if id_pattern:
-                self.id_pattern = id_pattern
-            if id:
-                self.id = id
+            self.id_pattern = id_pattern if id_pattern else None
+            self.id = id if id else None
 
         def to_dict(self):
             d = {}
@@ -207,9 +230,11 @@ class RegistrationInfo:
                 type=d["type"], id=d.get("id"), id_pattern=d.get("id_pattern")
             )
 
-    entities: list[EntityInfo] = None
-    property_names: list[str] = None
-    relationship_names: list[str] = None
+    __slots__ = ("entities", "property_names", "relationship_names")
+
+    entities: list[EntityInfo]
+    property_names: list[str]
+    relationship_names: list[str]
 
     def __init__(
         self,
@@ -229,17 +254,15 @@ class RegistrationInfo:
                 "entities, property_names and relationship_names shall not be empty lists"
             )
 
-        if entities:
-            self.entities = entities
-        if property_names:
-            self.property_names = property_names
-        if relationship_names:
-            self.relationship_names = relationship_names
+        self.entities = entities if entities else None
+        self.property_names = property_names if property_names else None
+        self.relationship_names = (
+            relationship_names if relationship_names else None
+        )
 
     def to_dict(self) -> dict:
         d = {}
         if self.entities:
-            print(self.entities)
             d["entities"] = [e.to_dict() for e in self.entities]
         if self.property_names:
             d["propertyNames"] = self.property_names
@@ -261,7 +284,7 @@ class RegistrationInfo:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CSourceRegistration:
     endpoint: str = None
     information: list[RegistrationInfo] = None
@@ -330,54 +353,59 @@ class CSourceRegistration:
         self.information.append(registration_info)
 
     def to_dict(self) -> dict:
-        d = {}
-        if self.id:
-            d["id"] = self.id
-        d["type"] = self.type
-        if self.registration_name:
-            d["registrationName"] = self.registration_name
-        if self.description:
-            d["description"] = self.description
-        if self.information:
-            d["information"] = []
-            for i in self.information:
-                if isinstance(i, RegistrationInfo):
-                    d["information"].append(i.to_dict())
-                else:
-                    d["information"].append(i)
-        if self.tenant:
-            d["tenant"] = self.tenant
-        if self.observation_interval:
-            d["observationInterval"] = self.observation_interval.to_dict()
-        if self.management_interval:
-            d["managementInterval"] = self.management_interval.to_dict()
-        if self.location:
-            d["location"] = self.location
-        if self.observation_space:
-            d["observationSpace"] = self.observation_space
-        if self.operation_space:
-            d["operationSpace"] = self.operation_space
-        if self.expires_at:
-            d["expiresAt"] = self.expires_at
-        d["endpoint"] = self.endpoint
-        if self.context_source_info:
-            d["contextSourceInfo"] = self.context_source_info
-        if self.scope:
-            d["scope"] = self.scope
-        if self.mode:
-            d["mode"] = self.mode
-        if self.operations:
-            d["operations"] = self.operations
-        if self.refresh_rate:
-            d["refreshRate"] = self.refresh_rate
-        if self.management:
-            d["management"] = self.management.to_dict()
-        # TODO: Check to use JSON
-        if self.other_properties:
-            for k, v in self.other_properties.items():
-                d[k] = v
-        d["@context"] = self.context
-        return d
+        return {
+            "type": self.type,
+            "endpoint": self.endpoint,
+            **{
+                k: v
+                for k, v in (
+                    ("id", self.id),
+                    ("registrationName", self.registration_name),
+                    ("description", self.description),
+                    (
+                        "information",
+                        [
+                            i.to_dict() if isinstance(i, RegistrationInfo) else i
+                            for i in self.information
+                        ]
+                        if self.information is not None
+                        else None,
+                    ),
+                    ("tenant", self.tenant),
+                    (
+                        "observationInterval",
+                        self.observation_interval.to_dict()
+                        if self.observation_interval is not None
+                        else None,
+                    ),
+                    (
+                        "managementInterval",
+                        self.management_interval.to_dict()
+                        if self.management_interval is not None
+                        else None,
+                    ),
+                    ("location", self.location),
+                    ("observationSpace", self.observation_space),
+                    ("operationSpace", self.operation_space),
+                    ("expiresAt", self.expires_at),
+                    ("contextSourceInfo", self.context_source_info),
+                    ("scope", self.scope),
+                    ("mode", self.mode),
+                    ("operations", self.operations),
+                    ("refreshRate", self.refresh_rate),
+                    (
+                        "management",
+                        self.management.to_dict()
+                        if self.management is not None
+                        else None,
+                    ),
+                )
+                if v is not None
+            },
+            # TODO: Check to use JSON
+            **(self.other_properties or {}),
+            "@context": self.context,
+        }
 
 
 class CSourceRegistrationBuilder:
@@ -401,21 +429,18 @@ class CSourceRegistrationBuilder:
         else:
             raise ValueError("information shall be a list of RegistrationInfo")
 
+    @expect(str, "id shall be a string")
     def id(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("id shall be a string")
         self._csourcereg.id = value
         return self
 
+    @expect(str, "registration name shall be a string")
     def registration_name(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("registration name shall be a string")
-        self._csourcereg.name = value
+        self._csourcereg.registration_name = value
         return self
 
+    @expect(str, "description shall be a string")
     def description(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("description shall be a string")
         self._csourcereg.description = value
         return self
 
@@ -431,65 +456,34 @@ class CSourceRegistrationBuilder:
         self._csourcereg.management_interval = TimeInterval(start_at, end_at)
         return self
 
-    def location(self, value: Union[Tuple, Geometry]):
-        if not isinstance(value, (tuple, Geometry)):
-            raise ValueError("location shall be a tuple or Geometry")
-
-        if isinstance(value, Tuple):
-            if len(value) == 2:
-                lat, lon = value
-                value = Point((lon, lat))
-            else:
-                raise ValueError("lat, lon tuple expected")
-
-        self._csourcereg.location = value
+    def location(self, value: Union[tuple, Geometry]):
+        self._csourcereg.location = _coerce_geom(value, "location")
         return self
 
-    def observation_space(self, value: Union[Tuple, Geometry]):
-        if not isinstance(value, (tuple, Geometry)):
-            raise ValueError("observation_space shall be a tuple or Geometry")
-
-        if isinstance(value, Tuple):
-            if len(value) == 2:
-                lat, lon = value
-                value = Point((lon, lat))
-            else:
-                raise ValueError("lat, lon tuple expected")
-
-        self._csourcereg.observation_space = value
+    def observation_space(self, value: Union[tuple, Geometry]):
+        self._csourcereg.observation_space = _coerce_geom(
+            value, "observation_space"
+        )
         return self
 
-    def operation_space(self, value: Union[Tuple, Geometry]):
-        if not isinstance(value, (tuple, Geometry)):
-            raise ValueError("operation_space shall be a tuple or Geometry")
-
-        if isinstance(value, Tuple):
-            if len(value) == 2:
-                lat, lon = value
-                value = Point((lon, lat))
-            else:
-                raise ValueError("lat, lon tuple expected")
-
-        self._csourcereg.operation_space = value
+    def operation_space(self, value: Union[tuple, Geometry]):
+        self._csourcereg.operation_space = _coerce_geom(
+            value, "operation_space"
+        )
         return self
 
+    @expect(datetime, "expires_at shall be a datetime")
     def expires_at(self, value: datetime):
-        if not isinstance(value, datetime):
-            raise ValueError("expires_at shall be a datetime")
-        self._csourcereg.expires_at = iso8601.from_datetime(value)
+        self._csourcereg.expires_at = _iso(value)
         return self
 
+    @expect(dict, "context_source_info shall be a dict, a generic key-value array")
     def context_source_info(self, value: dict):
-        if not isinstance(value, dict):
-            raise ValueError(
-                "context_source_info shall be a dict, a generic key-value array"
-            )
         self._csourcereg.context_source_info = value
         return self
 
+    @expect((str, list), "scope shall be a string or a list of strings")
     def scope(self, value: Union[str, List[str]]):
-        if not isinstance(value, str) and not isinstance(value, list):
-            raise ValueError("scope shall be a string or a list of strings")
         self._csourcereg.scope = value
         return self
 
@@ -499,29 +493,24 @@ class CSourceRegistrationBuilder:
             "inclusive", "exclusive", "redirect", "auxiliary"
         ] = "inclusive",
     ):
-        if not isinstance(value, str) and value not in [
-            "inclusive",
-            "exclusive",
-            "redirect",
-            "auxiliary",
-        ]:
+        if not isinstance(value, str) or value not in _MODE_VALID:
             raise ValueError(
                 "mode shall be a string matching one of the following values: inclusive, exclusive, redirect, auxiliary"
             )
         self._csourcereg.mode = value
         return self
 
+    @expect(list, "operations shall be a list of strings")
     def operations(
         self, value: List[Union[ImplementedOperation, OperationsGroup]]
     ):
-        if not isinstance(value, list):
-            raise ValueError("operations shall be a list of strings")
         self._csourcereg.operations = [op.value for op in value]
         return self
 
+    @expect(timedelta, "refresh_rate shall be a timedelta")
     def refresh_rate(self, value: timedelta):
-        if not isinstance(value, timedelta):
-            raise ValueError("refresh_rate shall be a timedelta")
+        import isodate
+
         self._csourcereg.refresh_rate = isodate.duration_isoformat(value)
         return self
 
@@ -532,16 +521,17 @@ class CSourceRegistrationBuilder:
         time: int = None,
         cooldown: int = None,
     ):
+        if time is not None and time < 0:
+            raise ValueError("timeout shall be greater than 0")
+        if cooldown is not None and cooldown < 0:
+            raise ValueError("cooldown shall be greater than 0")
         self._csourcereg.management = RegistrationManagementInfo(
             local_only, cache_duration, time, cooldown
         )
         return self
 
+    @expect(dict, "other_properties shall be a dict, a generic key-value array")
     def other_properties(self, value: dict):
-        if not isinstance(value, dict):
-            raise ValueError(
-                "other_properties shall be a dict, a generic key-value array"
-            )
         self._csourcereg.other_properties = value
         return self
 
@@ -10,8 +10,6 @@
 # Author: Fabien BATTELLO <fabien.battello@orange.com> et al.
 # Author: Jorge LANZA <jlanza@tlmat.unican.es> et al.
 
-from dataclasses import dataclass
-
 from typing import (
     Literal,
     Sequence,
@@ -28,17 +26,41 @@ from datetime import datetime
 
 from ngsildclient.utils import iso8601, url
 from ngsildclient.model.constants import CORE_CONTEXT
+from ngsildclient.api.helper import expect
+
+
+def _serializable(cls: type) -> type:
+    """Generate the _optional_items() method of a class from its _FIELDS table.
+
+    _FIELDS entries are (attribute, JSON key, default) and an item is kept unless None or its default.
+    The method is compiled once with straight-line attribute loads, as dataclasses does for __init__.
+    """
+    lines = ["def _optional_items(self):", "    d = {}"]
+    namespace = {}
+    for i, (attr, key, default) in enumerate(cls._FIELDS):
+        lines.append(f"    v = self.{attr}")
+        if default is None:
+            lines.append("    if v is not None:")
+        else:
+            namespace[f"_default_{i}"] = default
+            lines.append(f"    if v is not None and v != _default_{i}:")
+        lines.append(f"        d[{key!r}] = v")
+    lines.append("    return d")
+    exec("\n".join(lines), namespace)
+    cls._optional_items = namespace["_optional_items"]
+    return cls
 
 
-@dataclass
 class EntitySelector:
-    type: str
-    id: str = None
-    id_pattern: str = None
+    __slots__ = ("type", "id", "id_pattern")
+
+    def __init__(self, type: str, id: str = None, id_pattern: str = None):
+        self.type = type
+        self.id = id
+        self.id_pattern = id_pattern
 
     def to_dict(self) -> dict:
-        d = {}
-        d["type"] = self.type
+        d = {"type": self.type}
         if self.id:
             d["id"] = self.id
         if self.id_pattern:
@@ -46,109 +68,184 @@ class EntitySelector:
         return d
 
 
-@dataclass
+def _key_value_list(d: dict) -> list[dict]:
+    return [{k: v} for k, v in d.items()] if d else None
+
+
 class Endpoint:
-    uri: str
-    accept: str = "application/ld+json"
-    timeout: int = 0
-    cooldown: int = 0
-    receiver_info: dict = None
-    notifier_info: dict = None
+    __slots__ = (
+        "uri",
+        "accept",
+        "timeout",
+        "cooldown",
+        "receiver_info",
+        "notifier_info",
+    )
+
+    def __init__(
+        self,
+        uri: str,
+        accept: str = "application/ld+json",
+        timeout: int = 0,
+        cooldown: int = 0,
+        receiver_info: dict = None,
+        notifier_info: dict = None,
+    ):
+        self.uri = uri
+        self.accept = accept
+        self.timeout = timeout
+        self.cooldown = cooldown
+        self.receiver_info = receiver_info
+        self.notifier_info = notifier_info
 
     def to_dict(self) -> dict:
-        d = {}
-        d["uri"] = self.uri
-        d["accept"] = self.accept
+        d = {"uri": self.uri, "accept": self.accept}
         if self.timeout > 0:  # Has to be greater than 0
             d["timeout"] = self.timeout
         if self.cooldown > 0:  # Has to be greater than 0
             d["cooldown"] = self.cooldown
-        if self.receiver_info:
-            d["receiverInfo"] = [{k: v} for k, v in self.receiver_info.items()]
-        if self.notifier_info:
-            d["notifierInfo"] = [{k: v} for k, v in self.notifier_info.items()]
+        receiver_info = _key_value_list(self.receiver_info)
+        if receiver_info is not None:
+            d["receiverInfo"] = receiver_info
+        notifier_info = _key_value_list(self.notifier_info)
+        if notifier_info is not None:
+            d["notifierInfo"] = notifier_info
         return d
 
 
-@dataclass
+@_serializable
 class NotificationParams:
-    endpoint: Endpoint
-    attrs: list[str] = None
-    format: str = "normalized"
-    sys_attrs: bool = False
-    show_changes: bool = False
+    __slots__ = ("endpoint", "attrs", "format", "sys_attrs", "show_changes")
+
+    # sysAttrs and showChanges are false by default
+    _FIELDS = (
+        ("attrs", "attributes", None),
+        ("sys_attrs", "sysAttrs", False),
+        ("show_changes", "showChanges", False),
+    )
+
+    def __init__(
+        self,
+        endpoint: Endpoint,
+        attrs: list[str] = None,
+        format: str = "normalized",
+        sys_attrs: bool = False,
+        show_changes: bool = False,
+    ):
+        self.endpoint = endpoint
+        self.attrs = attrs
+        self.format = format
+        self.sys_attrs = sys_attrs
+        self.show_changes = show_changes
 
     def to_dict(self) -> dict:
-        d = {}
-        if self.attrs:
-            d["attributes"] = self.attrs
-        d["format"] = self.format
-        if self.sys_attrs:  # By default is false
-            d["sysAttrs"] = self.sys_attrs
-        if self.show_changes:  # By default is false
-            d["showChanges"] = self.show_changes
-        d["endpoint"] = self.endpoint.to_dict()
-        return d
+        return {
+            "format": self.format,
+            "endpoint": self.endpoint.to_dict(),
+            **self._optional_items(),
+        }
 
 
-@dataclass
+@_serializable
 class Subscription:
-    notification: NotificationParams
-    id: str = None
-    type: str = "Subscription"
-    name: str = None
-    description: str = None
-    entities: list[EntitySelector] = None  # id, idPattern, or type
-    watched_attrs: list[str] = None
-    notification_trigger: list[str] = None
-    time_interval: int = 0
-    query: str = None
-    # TODO: create Geo JSON
-    geo_query: str = None
-    csf: str = None
-    active: bool = True
-    expires_at: Union[str, datetime] = None
-    throttling: int = 0
-    temporal_query: str = None
-    scope: str = None
-    lang: str = None
-    ctx: str = CORE_CONTEXT
+    __slots__ = (
+        "notification",
+        "id",
+        "type",
+        "name",
+        "description",
+        "entities",
+        "watched_attrs",
+        "notification_trigger",
+        "time_interval",
+        "query",
+        "geo_query",
+        "csf",
+        "active",
+        "_expires_at",
+        "throttling",
+        "temporal_query",
+        "scope",
+        "lang",
+        "ctx",
+    )
+
+    # entities, timeInterval and throttling are serialized apart
+    _FIELDS = (
+        ("id", "id", None),
+        ("name", "subscriptionName", None),
+        ("description", "description", None),
+        ("watched_attrs", "watchedAttributes", None),
+        ("notification_trigger", "notificationTrigger", None),
+        ("query", "q", None),
+        ("csf", "csf", None),
+        ("_expires_at", "expiresAt", None),
+        ("temporal_query", "temporalQ", None),
+        ("scope", "scopeQ", None),
+        ("lang", "lang", None),
+    )
+
+    def __init__(
+        self,
+        notification: NotificationParams,
+        id: str = None,
+        type: str = "Subscription",
+        name: str = None,
+        description: str = None,
+        entities: list[Union[EntitySelector, dict]] = None,  # id, idPattern, or type
+        watched_attrs: list[str] = None,
+        notification_trigger: list[str] = None,
+        time_interval: int = 0,
+        query: str = None,
+        # TODO: create Geo JSON
+        geo_query: str = None,
+        csf: str = None,
+        active: bool = True,
+        expires_at: Union[str, datetime] = None,
+        throttling: int = 0,
+        temporal_query: str = None,
+        scope: str = None,
+        lang: str = None,
+        ctx: str = CORE_CONTEXT,
+    ):
+        self.notification = notification
+        self.id = id
+        self.type = type
+        self.name = name
+        self.description = description
+        self.entities = entities
+        self.watched_attrs = watched_attrs
+        self.notification_trigger = notification_trigger
+        self.time_interval = time_interval
+        self.query = query
+        self.geo_query = geo_query
+        self.csf = csf
+        self.active = active
+        self.expires_at = expires_at
+        self.throttling = throttling
+        self.temporal_query = temporal_query
+        self.scope = scope
+        self.lang = lang
+        self.ctx = ctx
+
+    @property
+    def expires_at(self) -> str:
+        return self._expires_at
+
+    @expires_at.setter
+    def expires_at(self, value: Union[str, datetime]):
+        # stored as an ISO8601 string so that to_dict() only reads it
+        self._expires_at = iso8601.from_datetime(value) if isinstance(value, datetime) else value
 
     def to_dict(self) -> dict:
-        d = {}
-        if self.id:
-            d["id"] = self.id
-        d["type"] = self.type
-        if self.name:
-            d["subscriptionName"] = self.name
-        if self.description:
-            d["description"] = self.description
+        d = {"type": self.type, **self._optional_items()}
         if self.entities:
-            d["entities"] = [e.to_dict() for e in self.entities]
-        if self.watched_attrs:
-            d["watchedAttributes"] = self.watched_attrs
-        if self.notification_trigger:
-            d["notificationTrigger"] = self.notification_trigger
+            # SubscriptionBuilder stores already serialized selectors
+            d["entities"] = [e.to_dict() if isinstance(e, EntitySelector) else e for e in self.entities]
         if self.time_interval > 0 and not self.watched_attrs:
             d["timeInterval"] = self.time_interval
-        if self.query:
-            d["q"] = self.query
-        if self.csf:
-            d["csf"] = self.csf
-        if self.expires_at:
-            if isinstance(self.expires_at, datetime):
-                d["expiresAt"] = iso8601.from_datetime(self.expires_at)
-            else:
-                d["expiresAt"] = self.expires_at
         if self.throttling > 0 and not self.time_interval:
             d["throttling"] = self.throttling
-        if self.temporal_query:
-            d["temporalQ"] = self.temporal_query
-        if self.scope:
-            d["scopeQ"] = self.scope
-        if self.scope:
-            d["lang"] = self.scope
-
         d["isActive"] = self.active
         d["notification"] = self.notification.to_dict()
         d["@context"] = self.ctx
@@ -163,21 +260,18 @@ class SubscriptionBuilder:
         self._subscr = Subscription(notification)
         self._subscr.entities = []
 
+    @expect(str, "id shall be a string")
     def id(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("id shall be a string")
         self._subscr.id = value
         return self
 
+    @expect(str, "name shall be a string")
     def name(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("name shall be a string")
         self._subscr.name = value
         return self
 
+    @expect(str, "description shall be a string")
     def description(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("description shall be a string")
         self._subscr.description = value
         return self
 
@@ -190,34 +284,35 @@ class SubscriptionBuilder:
             raise ValueError("EntitySelector id shall be a string")
         if id_pattern and not isinstance(id_pattern, str):
             raise ValueError("EntitySelector idPattern shall be a string")
-        self._subscr.entities.append(EntitySelector(type, id, id_pattern))
+        self._subscr.entities.append(EntitySelector(type, id, id_pattern).to_dict())
+        return self
+
+    @expect((str, datetime), "expires_at shall be a string or a datetime")
+    def expires_at(self, value: Union[str, datetime]):
+        self._subscr.expires_at = value
         return self
 
+    @expect(list, "watchedAttributes shall be a list of strings")
     def watch(self, value: list[str]):
-        if not isinstance(value, list):
-            raise ValueError("watchedAttributes shall be a list of strings")
         if value == []:
             raise ValueError("Empty array is not allowed")
         self._subscr.watched_attrs = value
         return self
 
+    @expect(str, "query shall be a string")
     def query(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("query shall be a string")
         self._subscr.query = url.escape(value)
         return self
 
+    @expect(list, "attribute names shall be a list of strings")
     def notif(self, value: list[str]):
-        if not isinstance(value, list):
-            raise ValueError("attribute names shall be a list of strings")
         if value == []:
             raise ValueError("Empty array is not allowed")
         self._subscr.notification.attrs = value
         return self
 
+    @expect(str, "context shall be a string")
     def context(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("context shall be a string")
         self._subscr.ctx = value
         return self
 
@@ -24,6 +24,9 @@ from ..exceptions import NgsiUnmatchedAttributeTypeError
 import ngsildclient.model.ngsidict as ngsidict
 
 
+_TYPE_GEO = AttrType.GEO.value
+
+
 class AttrGeoValue(ngsidict.NgsiDict):
     @property
     def value(self):
@@ -49,16 +52,15 @@ class AttrGeoValue(ngsidict.NgsiDict):
         cls,
         attrV: AttrValue,
     ) -> AttrGeoValue:
-        property: AttrGeoValue = cls()
         value = attrV.value
         if isinstance(value, (Point, LineString, Polygon, MultiPoint)):
             geometry = value
         else:
             raise NgsiUnmatchedAttributeTypeError(f"Cannot map {type(value)} to NGSI type. {value=}")
-        property["type"] = AttrType.GEO.value
-        property["value"] = geometry
-        if attrV.observedat is not None:
-            property[META_ATTR_OBSERVED_AT] = process_observedat(attrV.observedat)
-        if attrV.datasetid is not None:
-            property[META_ATTR_DATASET_ID] = Urn.prefix(attrV.datasetid)
-        return property
+        d = {"type": _TYPE_GEO, "value": geometry}
+        observedat, datasetid = attrV.observedat, attrV.datasetid
+        if observedat is not None:
+            d[META_ATTR_OBSERVED_AT] = process_observedat(observedat)
+        if datasetid is not None:
+            d[META_ATTR_DATASET_ID] = Urn.prefix(datasetid)
+        return cls(d)
@@ -21,6 +21,11 @@ from ..constants import *
 from ..exceptions import *
 
 
+_TYPE_PROP = AttrType.PROP.value
+
+_PRIM_TYPES = frozenset((int, float, bool, str, list, dict))
+
+
 class AttrPropValue(ngsildclient.model.ngsidict.NgsiDict):
     @property
     def type(self):
@@ -70,20 +75,20 @@ class AttrPropValue(ngsildclient.model.ngsidict.NgsiDict):
         cls,
         attrV: AttrValue,
     ) -> AttrPropValue:
-        property: AttrPropValue = cls()
         value = attrV.value
-        if isinstance(value, (int, float, bool, str, list, dict)):
+        # exact types first, subclasses (e.g. IntEnum, OrderedDict) through isinstance()
+        if type(value) in _PRIM_TYPES or isinstance(value, (int, float, str, list, dict)):
             v = value
         else:
             raise NgsiUnmatchedAttributeTypeError(f"Cannot map {type(value)} to NGSI type. {value=}")
-        property["type"] = AttrType.PROP.value  # set type
-        property["value"] = v  # set value
-        if attrV.unitcode is not None:
-            property[META_ATTR_UNITCODE] = attrV.unitcode
-        if attrV.observedat is not None:
-            property[META_ATTR_OBSERVED_AT] = process_observedat(attrV.observedat)
-        if attrV.datasetid is not None:
-            property[META_ATTR_DATASET_ID] = Urn.prefix(attrV.datasetid)
-        if attrV.userdata:
-            property |= attrV.userdata
-        return property
+        d = {"type": _TYPE_PROP, "value": v}
+        unitcode, observedat, datasetid, userdata = attrV.unitcode, attrV.observedat, attrV.datasetid, attrV.userdata
+        if unitcode is not None:
+            d[META_ATTR_UNITCODE] = unitcode
+        if observedat is not None:
+            d[META_ATTR_OBSERVED_AT] = process_observedat(observedat)
+        if datasetid is not None:
+            d[META_ATTR_DATASET_ID] = Urn.prefix(datasetid)
+        if userdata:
+            d.update(userdata.data if isinstance(userdata, ngsildclient.model.ngsidict.NgsiDict) else userdata)
+        return cls(d)
@@ -19,6 +19,9 @@ from ..constants import *
 from ..exceptions import *
 
 
+_TYPE_REL = AttrType.REL.value
+
+
 class AttrRelValue(ngsildclient.model.ngsidict.NgsiDict):
     @property
     def type(self):
@@ -64,22 +67,21 @@ class AttrRelValue(ngsildclient.model.ngsidict.NgsiDict):
         cls,
         attrV: AttrValue,
     ) -> AttrRelValue:
-        property: AttrRelValue = cls()
         value = attrV.value
         if isinstance(value, str):
             value = Urn.prefix(value)
         elif isinstance(value, Sequence):
-            value = [Urn.prefix(v) for v in value]
+            prefix = Urn.prefix
+            # items are ids or entities
+            value = [prefix(v if isinstance(v, str) else v.id) for v in value]
         else:
             raise NgsiUnmatchedAttributeTypeError(
                 f"Cannot map {type(value)} to NGSI type. {value=}"
             )
-        property["type"] = AttrType.REL.value  # set type
-        property["object"] = value  # set value
-        if attrV.observedat is not None:
-            property[META_ATTR_OBSERVED_AT] = process_observedat(
-                attrV.observedat
-            )
-        if attrV.datasetid is not None:
-            property[META_ATTR_DATASET_ID] = Urn.prefix(attrV.datasetid)
-        return property
+        d = {"type": _TYPE_REL, "object": value}
+        observedat, datasetid = attrV.observedat, attrV.datasetid
+        if observedat is not None:
+            d[META_ATTR_OBSERVED_AT] = process_observedat(observedat)
+        if datasetid is not None:
+            d[META_ATTR_DATASET_ID] = Urn.prefix(datasetid)
+        return cls(d)
@@ -19,6 +19,9 @@ from ngsildclient.model.constants import AttrValue, AttrType
 from ngsildclient.utils import iso8601
 
 
+_TYPE_TEMPORAL = AttrType.TEMPORAL.value
+
+
 class AttrTemporalValue(ngsidict.NgsiDict):
     @property
     def value(self) -> Union[datetime, date, time]:
@@ -45,13 +48,10 @@ class AttrTemporalValue(ngsidict.NgsiDict):
         cls,
         attrV: AttrValue,
     ) -> AttrTemporalValue:
-        property: AttrTemporalValue = cls()
-        value = attrV.value
-        date_str, temporaltype, _ = iso8601.parse(value)
-        v = {
-            "@type": temporaltype.value,
-            "@value": date_str,
-        }
-        property["type"] = AttrType.TEMPORAL.value
-        property["value"] = v  # set value
-        return property
+        date_str, temporaltype, _ = iso8601.parse(attrV.value)
+        return cls(
+            {
+                "type": _TYPE_TEMPORAL,
+                "value": {"@type": temporaltype.value, "@value": date_str},
+            }
+        )
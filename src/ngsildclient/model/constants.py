@@ -36,6 +36,8 @@ from geojson import (
 )
 from dataclasses import dataclass, field
 
+from ngsildclient.utils import DATACLASS_SLOTS
+
 if TYPE_CHECKING:
     import ngsildclient.model.entity as entity
 
@@ -71,7 +73,7 @@ META_ATTR_DATASET_ID = "datasetId"
 UTC = tz.UTC
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AttrValue:
     value: Any
     datasetid: str = None  # MUST be set for multi-attributes properties
@@ -21,7 +21,6 @@ from copy import deepcopy
 from functools import partialmethod
 from datetime import datetime
 from typing import (
-    Sequence,
     Any,
     Union,
     List,
@@ -51,6 +50,8 @@ from ngsildclient.settings import globalsettings
 
 logger = logging.getLogger(__name__)
 
+_REL_NAMES = {rel: rel.value for rel in Rel}
+
 """This module contains the definition of the Entity class.
 """
 
@@ -437,7 +438,7 @@ class Entity:
     def _update_entity(
         self, attrname: str, property: NgsiDict, nested: bool = False
     ):
-        ismulti = isinstance(property, Sequence)
+        ismulti = isinstance(property, list)  # multi-attributes are built as lists
         nested |= self._anchored
         if nested and not self._lastwasmulti:
             # update _lastprop only if not anchored
@@ -539,7 +540,7 @@ class Entity:
     ) -> Entity:
         if nested and self._lastwasmulti:
             raise ValueError("Nesting multi-attribute is not allowed")
-        name = name.value if isinstance(name, Rel) else name
+        name = _REL_NAMES.get(name, name)
         property = NgsiDict.mkrel(
             value, datasetid=datasetid, observedat=observedat
         )
@@ -591,6 +592,8 @@ class Entity:
     def to_json(self, *args, pattern: str = None, **kwargs) -> str:
         """Returns the entity as JSON.
 
+        When orjson is installed the output is compact and NaN values are written as null.
+
         Returns
         -------
         str
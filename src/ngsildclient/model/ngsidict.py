@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Literal, Tuple, TYPE_CHECKING
+from typing import Any, Callable, List, Literal, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ngsildclient.model.attr.prop import AttrPropValue
@@ -26,7 +26,7 @@ from copy import deepcopy
 from datetime import datetime
 from scalpl import Cut
 
-from ..utils import iso8601, url
+from ..utils import iso8601, url, is_orjson_installed
 from .constants import *
 from .exceptions import *
 from ngsildclient.settings import globalsettings
@@ -37,8 +37,46 @@ import json
 """This module contains the definition of the NgsiDict class.
 """
 
+# bound once for the serialization paths
+_json_dumps = json.dumps
+_json_loads = json.loads
+_json_load = json.load
 
-class NgsiDict(Cut, MutableMapping):
+
+def _json_default(x: Any) -> Any:
+    # NgsiDict nodes are serialized through their underlying dict, anything else as a string
+    return x.data if isinstance(x, NgsiDict) else str(x)
+
+
+if is_orjson_installed():
+    import orjson
+
+    # Output may differ from the json module fallback: it is compact (no space after separators),
+    # NaN and infinities are written as null, and Enum members as their value.
+    _orjson_dumps = orjson.dumps
+    # keys are stringified and datetimes/dataclasses handed to default, as the json module does
+    _OPT_ORJSON = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    _OPT_INDENT_2 = _OPT_ORJSON | orjson.OPT_INDENT_2
+
+    def _dumps(obj: Any, indent: int = None, default: Callable = None) -> str:
+        # orjson only knows how to indent by 2 spaces
+        if indent is None or indent == 2:
+            try:
+                return _orjson_dumps(
+                    obj, default=default, option=_OPT_ORJSON if indent is None else _OPT_INDENT_2
+                ).decode("utf-8")
+            except TypeError:
+                # input orjson rejects but the json module accepts (e.g. integers beyond 64 bits)
+                pass
+        return _json_dumps(obj, ensure_ascii=False, indent=indent, default=default)
+
+else:
+
+    def _dumps(obj: Any, indent: int = None, default: Callable = None) -> str:
+        return _json_dumps(obj, ensure_ascii=False, indent=indent, default=default)
+
+
+class NgsiDict(Cut):
     """This class is a custom dictionary that backs an entity.
 
     Attr is used to build and hold the entity properties, as well as the entity's root.
@@ -58,16 +96,34 @@ class NgsiDict(Cut, MutableMapping):
         return self.get("@context") is not None
 
     def __getitem__(self, path: str):
-        item = super().__getitem__(path)
+        # plain keys (no "->" separator nor [index]) skip the scalpl path parsing
+        if "->" not in path and "[" not in path:
+            item = self.data[path]
+        else:
+            item = super().__getitem__(path)
         if isinstance(item, Mapping) and not isinstance(item, NgsiDict):
             from ngsildclient.model.attr.factory import AttrFactory
 
             return AttrFactory.create(item)
         return item
 
+    def __setitem__(self, path: str, value: Any):
+        if "->" not in path and "[" not in path:
+            self.data[path] = value
+        else:
+            super().__setitem__(path, value)
+
+    def __contains__(self, path: str) -> bool:
+        if "->" not in path and "[" not in path:
+            return path in self.data
+        return super().__contains__(path)
+
     def get(self, path: str, default=None):
         try:
-            item = super().__getitem__(path)
+            if "->" not in path and "[" not in path:
+                item = self.data[path]
+            else:
+                item = super().__getitem__(path)
         except (KeyError, IndexError):
             return default
         if isinstance(item, Mapping) and not isinstance(item, NgsiDict):
@@ -120,26 +176,27 @@ class NgsiDict(Cut, MutableMapping):
 
     @classmethod
     def _from_json(cls, payload: str):
-        d = json.loads(payload)
+        d = _json_loads(payload)
         return cls(d)
 
     @classmethod
     def _load(cls, filename: str):
         with open(filename, "r") as fp:
-            d = json.load(fp)
+            d = _json_load(fp)
             return cls(d)
 
     def to_dict(self) -> dict:
         return self.data
 
     def to_json(self, pattern: str = None, indent: int = None) -> str:
-        """Returns the dict in json format"""
+        """Returns the dict in json format
+
+        When orjson is installed the output is compact and NaN values are written as null.
+        """
         if pattern:
             pattern = pattern.lower()
         d = {k: v for k, v in self.items() if pattern in k.lower()} if pattern else self
-        return json.dumps(
-            d, ensure_ascii=False, indent=indent, default=lambda x: x.data if isinstance(x, NgsiDict) else str
-        )
+        return _dumps(d, indent, default=_json_default)
 
     def pprint(self, *args, **kwargs) -> None:
         """Returns the dict pretty-json-formatted"""
@@ -147,13 +204,7 @@ class NgsiDict(Cut, MutableMapping):
 
     def _save(self, filename: str, indent=2):
         with open(filename, "w") as fp:
-            json.dump(
-                self,
-                fp,
-                ensure_ascii=False,
-                indent=indent,
-                default=lambda x: x.data if isinstance(x, NgsiDict) else str,
-            )
+            fp.write(_dumps(self, indent, default=_json_default))
 
     @classmethod
     def mkprop(
@@ -172,7 +223,8 @@ class NgsiDict(Cut, MutableMapping):
         if isinstance(value, MultAttrValue):
             if len(value) == 0:
                 raise ValueError("MultAttr is empty")
-            p: List[AttrPropValue] = [AttrPropValue.build(v) for v in value]
+            build = AttrPropValue.build
+            p: List[AttrPropValue] = [build(v) for v in value]
         else:
             value = url.escape(value) if escape and isinstance(value, str) else value
             attrvalue = AttrValue(value, datasetid, observedat, unitcode, userdata)
@@ -228,9 +280,15 @@ class NgsiDict(Cut, MutableMapping):
         if isinstance(value, MultAttrValue):
             if len(value) == 0:
                 raise ValueError("MultAttr is empty")
-            p: List[AttrRelValue] = [AttrRelValue.build(v.id if hasattr(v, "id") else v) for v in value]
+            # MultAttrValue.add() already resolved entities to their ids
+            build = AttrRelValue.build
+            p: List[AttrRelValue] = [build(v) for v in value]
         else:
             value = value.id if hasattr(value, "id") else value
             attrvalue = AttrValue(value, datasetid, observedat)
             p = AttrRelValue.build(attrvalue)
         return {attrname: p} if attrname else p
+
+
+# Cut already implements the whole mapping protocol, register rather than inherit the mixin methods
+MutableMapping.register(NgsiDict)
@@ -27,7 +27,7 @@ class NgsiEncoder(JSONEncoder):
     def default(self, o):
         if isinstance(o, (ngsidict.NgsiDict, entity.Entity)):
             return o.to_dict()
-        return str
+        return str(o)
 
 
 def guess_ngsild_type(
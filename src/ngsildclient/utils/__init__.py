@@ -15,6 +15,9 @@
 import sys
 import importlib.util
 
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""Keyword arguments that turn on dataclass slots where supported (Python 3.10+)."""
+
 
 def is_interactive() -> bool:
     return hasattr(sys, "ps1") or sys.flags.interactive
@@ -24,6 +27,10 @@ def is_pandas_installed() -> bool:
     return importlib.util.find_spec("pandas") is not None
 
 
+def is_orjson_installed() -> bool:
+    return importlib.util.find_spec("orjson") is not None
+
+
 def _addopt(params: dict, newopt: str):
     if params.get("options", "") == "":
         params["options"] = newopt
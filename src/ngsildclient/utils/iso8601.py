@@ -32,6 +32,7 @@ from dateutil.tz import UTC
 from typing import Union, Optional, Literal, Tuple
 from datetime import datetime, date, time
 from contextlib import suppress
+from functools import lru_cache
 
 from ngsildclient.model.constants import TemporalType
 
@@ -141,10 +142,12 @@ def to_time(value: str) -> time:
     return isoparser().parse_isotime(value)
 
 
+@lru_cache(maxsize=1024)
 def _from_string(value: str) -> tuple[str, TemporalType, datetime]:
     """Guess the temporal date type from a given string.
 
     This function should not be called by the end user. It is used internally by the `parse()` function.
+    Results are memoized since the same timestamps tend to recur across the attributes being built.
 
     Parameters
     ----------
@@ -15,6 +15,7 @@ This module contains a few helper functions to deal with URLs.
 
 import urllib.parse
 import re
+from functools import lru_cache
 
 
 URL_PATTERN = re.compile(r"^http[s]{0,1}://")
@@ -22,9 +23,12 @@ URL_PATTERN = re.compile(r"^http[s]{0,1}://")
 """
 
 
+@lru_cache(maxsize=1024)
 def escape(value: str) -> str:
     """URLEncode an URL.
 
+    Results are memoized since property values to escape tend to recur.
+
     Parameters
     ----------
     value : str
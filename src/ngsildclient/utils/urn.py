@@ -196,7 +196,7 @@ class Urn:
         """
         if value is None:
             return None
-        return value if Urn.is_prefixed(value) else f"urn:ngsi-ld:{value}"
+        return value if value.startswith("urn:ngsi-ld:") else f"urn:ngsi-ld:{value}"
 
     @staticmethod
     def unprefix(value: str) -> str:
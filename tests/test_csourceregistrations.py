@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# Software Name: ngsildclient
+# SPDX-FileCopyrightText: Copyright (c) 2021 UNICAN
+# SPDX-License-Identifier: Apache 2.0
+#
+# This software is distributed under the Apache 2.0;
+# see the NOTICE file for more details.
+#
+# Author: Jorge LANZA <jlanza@tlmat.unican.es> et al.
+
+import json
+import pytest
+
+from ngsildclient.api.client import Client
+from ngsildclient.api.exceptions import NgsiPartialRegistrationError
+from ngsildclient.api.csourceregistrations import CSourceRegistrations, _dumps
+from ngsildclient.api.helper.csourceregistration import CSourceRegistrationBuilder, RegistrationInfo
+
+ENDPOINT = "http://my.csource.org:1026"
+
+
+def test_hash_ignores_key_order():
+    csource1 = {"endpoint": ENDPOINT, "information": [{"entities": [{"type": "Room", "id": "urn:ngsi-ld:Room:001"}]}]}
+    csource2 = {"information": [{"entities": [{"id": "urn:ngsi-ld:Room:001", "type": "Room"}]}], "endpoint": ENDPOINT}
+    assert CSourceRegistrations._hash(csource1) == CSourceRegistrations._hash(csource2)
+
+
+def test_hash_ignores_non_criteria():
+    csource1 = {"endpoint": ENDPOINT, "information": [{"entities": [{"type": "Room"}]}]}
+    csource2 = {**csource1, "id": "urn:ngsi-ld:ContextSourceRegistration:001", "description": "rooms"}
+    assert CSourceRegistrations._hash(csource1) == CSourceRegistrations._hash(csource2)
+
+
+def test_hash_differs_on_criteria():
+    csource1 = {"endpoint": ENDPOINT, "information": [{"entities": [{"type": "Room"}]}]}
+    csource2 = {"endpoint": ENDPOINT, "information": [{"entities": [{"type": "Building"}]}]}
+    assert CSourceRegistrations._hash(csource1) != CSourceRegistrations._hash(csource2)
+
+
+def test_hash_distinguishes_list_from_dict():
+    csource1 = {"endpoint": ENDPOINT, "information": [{"propertyNames": [["type", "Room"]]}]}
+    csource2 = {"endpoint": ENDPOINT, "information": [{"propertyNames": [{"type": "Room"}]}]}
+    assert CSourceRegistrations._hash(csource1) != CSourceRegistrations._hash(csource2)
+
+
+def test_api_query(mocked_connected, requests_mock):
+    requests_mock.get(
+        "http://localhost:1026/ngsi-ld/v1/csourceRegistrations?type=Room&timerel=before&timeAt=2022-01-01T00:00:00Z",
+        complete_qs=True,
+        status_code=200,
+        json=[],
+    )
+    client = Client()
+    res = client.csourceregs.query([], type="Room", timerel="before", timeAt="2022-01-01T00:00:00Z")
+    assert res == []
+
+
+def test_api_query_bad_timerel(mocked_connected):
+    client = Client()
+    with pytest.raises(ValueError):
+        client.csourceregs.query([], type="Room", timerel="during")
+
+
+def test_api_register_many(mocked_connected, requests_mock):
+    def location(request, context):
+        context.headers["Location"] = f"/ngsi-ld/v1/csourceRegistrations/{request.json()['id']}"
+        return ""
+
+    requests_mock.post(
+        "http://localhost:1026/ngsi-ld/v1/csourceRegistrations/",
+        status_code=201,
+        text=location,
+    )
+    client = Client()
+    ids = [f"urn:ngsi-ld:ContextSourceRegistration:{i:03}" for i in range(8)]
+    csourceregs = [
+        CSourceRegistrationBuilder(ENDPOINT, RegistrationInfo(entities=[RegistrationInfo.EntityInfo(f"Room{i}")]))
+        .id(id)
+        .build()
+        for i, id in enumerate(ids)
+    ]
+    res = client.csourceregs.register_many(csourceregs, max_inflight=4)
+    assert res == ids
+    assert len([r for r in requests_mock.request_history if r.method == "POST"]) == 8
+
+
+def test_api_register_many_partial_failure(mocked_connected, requests_mock):
+    def location(request, context):
+        id = request.json()["id"]
+        if id.endswith("001"):
+            context.status_code = 500
+            return ""
+        context.headers["Location"] = f"/ngsi-ld/v1/csourceRegistrations/{id}"
+        return ""
+
+    requests_mock.post(
+        "http://localhost:1026/ngsi-ld/v1/csourceRegistrations/",
+        status_code=201,
+        text=location,
+    )
+    client = Client()
+    ids = [f"urn:ngsi-ld:ContextSourceRegistration:{i:03}" for i in range(3)]
+    csourceregs = [
+        CSourceRegistrationBuilder(ENDPOINT, RegistrationInfo(entities=[RegistrationInfo.EntityInfo(f"Room{i}")]))
+        .id(id)
+        .build()
+        for i, id in enumerate(ids)
+    ]
+    with pytest.raises(NgsiPartialRegistrationError) as e:
+        client.csourceregs.register_many(csourceregs)
+    assert e.value.ids == [ids[0], None, ids[2]]
+    assert list(e.value.errors) == [1]
+
+
+def test_api_register_many_duplicate(mocked_connected, requests_mock):
+    requests_mock.post("http://localhost:1026/ngsi-ld/v1/csourceRegistrations/", status_code=201)
+    client = Client()
+    csourceregs = [
+        CSourceRegistrationBuilder(ENDPOINT, RegistrationInfo(entities=[RegistrationInfo.EntityInfo("Room")]))
+        .id(f"urn:ngsi-ld:ContextSourceRegistration:{i:03}")
+        .build()
+        for i in range(2)
+    ]
+    with pytest.raises(ValueError):
+        client.csourceregs.register_many(csourceregs)
+    assert not [r for r in requests_mock.request_history if r.method == "POST"]
+
+
+def test_dumps_free_form():
+    csource = {"contextSourceInfo": {1: "a"}, "size": 2**70, "@context": "http://a.org/ctx.jsonld"}
+    assert json.loads(_dumps(csource)) == json.loads(json.dumps(csource))
@@ -364,3 +364,9 @@ def test_store_1_many_relationship():
     m.add("Shelf002", datasetid="Relationship:2")
     e.rel("furniture", m)
     assert e.to_dict() == expected_dict("store_1_many_relationship")
+
+
+def test_rel_to_many_entities():
+    e = Entity("Building", "store001")
+    e.rel("hasPart", [Entity("Shelf", "Shelf001"), "Shelf:Shelf002"])
+    assert e["hasPart"]["object"] == ["urn:ngsi-ld:Shelf:Shelf001", "urn:ngsi-ld:Shelf:Shelf002"]
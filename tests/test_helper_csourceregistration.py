@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Software Name: ngsildclient
+# SPDX-FileCopyrightText: Copyright (c) 2021 UNICAN
+# SPDX-License-Identifier: Apache 2.0
+#
+# This software is distributed under the Apache 2.0;
+# see the NOTICE file for more details.
+#
+# Author: Jorge LANZA <jlanza@tlmat.unican.es> et al.
+
+import pytest
+
+from geojson import Point
+
+from ngsildclient.api.helper.csourceregistration import (
+    CSourceRegistrationBuilder,
+    RegistrationInfo,
+)
+
+ENDPOINT = "http://my.csource.org:1026"
+
+
+def sample_info() -> RegistrationInfo:
+    return RegistrationInfo(entities=[RegistrationInfo.EntityInfo("Room")])
+
+
+def test_to_dict_is_not_shared():
+    csourcereg = CSourceRegistrationBuilder(ENDPOINT, sample_info()).management(time=10).build()
+    d = csourcereg.to_dict()
+    d["description"] = "leak"
+    d["information"].append({"propertyNames": ["leak"]})
+    d["management"]["timeout"] = 99
+    d = csourcereg.to_dict()
+    assert "description" not in d
+    assert d["information"] == [{"entities": [{"type": "Room"}]}]
+    assert d["management"] == {"timeout": 10}
+
+
+def test_to_dict_reflects_updates():
+    builder = CSourceRegistrationBuilder(ENDPOINT, sample_info())
+    csourcereg = builder.build()
+    d = csourcereg.to_dict()
+    builder.description("rooms")
+    assert "description" not in d
+    assert csourcereg.to_dict()["description"] == "rooms"
+    csourcereg.information[0].property_names = ["temperature"]
+    assert csourcereg.to_dict()["information"][0]["propertyNames"] == ["temperature"]
+    csourcereg.add_registration_info(RegistrationInfo(property_names=["humidity"]))
+    assert len(csourcereg.to_dict()["information"]) == 2
+
+
+def test_mode():
+    builder = CSourceRegistrationBuilder(ENDPOINT, sample_info())
+    assert builder.mode("exclusive").build().to_dict()["mode"] == "exclusive"
+    with pytest.raises(ValueError):
+        builder.mode("partial")
+    with pytest.raises(ValueError):
+        builder.mode(["inclusive"])
+
+
+def test_registration_name():
+    csourcereg = CSourceRegistrationBuilder(ENDPOINT, sample_info()).registration_name("rooms").build()
+    assert csourcereg.to_dict()["registrationName"] == "rooms"
+
+
+def test_management_keeps_false_values():
+    csourcereg = CSourceRegistrationBuilder(ENDPOINT, sample_info()).management(local_only=False).build()
+    assert csourcereg.to_dict()["management"] == {"localOnly": False}
+
+
+def test_location():
+    builder = CSourceRegistrationBuilder(ENDPOINT, sample_info())
+    assert builder.location((43.4623, -3.8099)).build().to_dict()["location"] == Point((-3.8099, 43.4623))
+    assert builder.operation_space(Point((-3.8, 43.4))).build().to_dict()["operationSpace"] == Point((-3.8, 43.4))
+    with pytest.raises(ValueError):
+        builder.observation_space((43.4623, -3.8099, 10))
+    with pytest.raises(ValueError):
+        builder.observation_space([43.4623, -3.8099])
+    with pytest.raises(ValueError):
+        builder.location(("a", "b"))
+    with pytest.raises(ValueError):
+        builder.location((None, 1))
+
+
+def test_management_cooldown():
+    builder = CSourceRegistrationBuilder(ENDPOINT, sample_info())
+    csourcereg = builder.management(time=10, cooldown=30).build()
+    assert csourcereg.to_dict()["management"] == {"timeout": 10, "cooldown": 30}
+    with pytest.raises(ValueError):
+        builder.management(cooldown=-1)
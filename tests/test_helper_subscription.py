@@ -9,7 +9,17 @@
 #
 # Author: Fabien BATTELLO <fabien.battello@orange.com> et al.
 
-from ngsildclient.api.helper.subscription import SubscriptionBuilder
+import pytest
+
+from datetime import datetime, timezone
+
+from ngsildclient.api.helper.subscription import (
+    Endpoint,
+    EntitySelector,
+    NotificationParams,
+    Subscription,
+    SubscriptionBuilder,
+)
 
 NOTIF_URI = "http://tutorial:3000/subscription/low-stock-farm001-ngsild"
 
@@ -41,3 +51,67 @@ def test_build_subscription():
         },
         "@context": "https://uri.etsi.org/ngsi-ld/v1/ngsi-ld-core-context.jsonld",
     }
+
+
+def test_build_subscription_notification_endpoint():
+    subscription = SubscriptionBuilder(NOTIF_URI, {"Authorization": "Bearer token"}).select_entities("FillingLevelSensor").build()
+    notification = subscription.to_dict()["notification"]
+    assert notification["endpoint"]
+    assert notification["endpoint"] == {
+        "uri": NOTIF_URI,
+        "accept": "application/ld+json",
+        "receiverInfo": [{"Authorization": "Bearer token"}],
+    }
+
+
+def test_build_subscription_entities():
+    subscription = (
+        SubscriptionBuilder(NOTIF_URI)
+        .select_entities("FillingLevelSensor")
+        .select_entities("Room", id_pattern="urn:ngsi-ld:Room:.*")
+        .build()
+    )
+    assert subscription.to_dict()["entities"] == [
+        {"type": "FillingLevelSensor"},
+        {"type": "Room", "idPattern": "urn:ngsi-ld:Room:.*"},
+    ]
+
+
+def test_build_subscription_notification_defaults():
+    subscription = SubscriptionBuilder(NOTIF_URI).select_entities("FillingLevelSensor").build()
+    assert subscription.to_dict()["notification"] == {
+        "format": "normalized",
+        "endpoint": {"uri": NOTIF_URI, "accept": "application/ld+json"},
+    }
+    subscription.notification.sys_attrs = True
+    assert subscription.to_dict()["notification"]["sysAttrs"] is True
+
+
+def test_subscription_entity_selectors():
+    subscription = Subscription(
+        NotificationParams(Endpoint(NOTIF_URI)),
+        entities=[EntitySelector("Room", id="urn:ngsi-ld:Room:001"), {"type": "Building"}],
+    )
+    assert subscription.to_dict()["entities"] == [
+        {"type": "Room", "id": "urn:ngsi-ld:Room:001"},
+        {"type": "Building"},
+    ]
+
+
+def test_build_subscription_expires_at():
+    builder = SubscriptionBuilder(NOTIF_URI).select_entities("FillingLevelSensor")
+    subscription = builder.expires_at(datetime(2022, 1, 1, 12, tzinfo=timezone.utc)).build()
+    assert subscription.expires_at == "2022-01-01T12:00:00Z"
+    assert subscription.to_dict()["expiresAt"] == "2022-01-01T12:00:00Z"
+    with pytest.raises(ValueError):
+        builder.expires_at(1640995200)
+
+
+def test_endpoint_receiver_info_is_not_shared():
+    endpoint = Endpoint(NOTIF_URI, receiver_info={"Authorization": "Bearer a"})
+    d = endpoint.to_dict()
+    d["receiverInfo"][0]["Authorization"] = "Bearer b"
+    d["receiverInfo"].append({"B": "2"})
+    assert endpoint.to_dict()["receiverInfo"] == [{"Authorization": "Bearer a"}]
+    endpoint.receiver_info["B"] = "2"
+    assert endpoint.to_dict()["receiverInfo"] == [{"Authorization": "Bearer a"}, {"B": "2"}]
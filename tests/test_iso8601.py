@@ -59,6 +59,11 @@ def test_parse_bad_format_wrong_date():
         iso8601.parse(d)
 
 
+def test_parse_string_is_memoized():
+    d = "2021-09-17T09:25:00Z"
+    assert iso8601.parse(d) is iso8601.parse(d)
+
+
 def test_extract_datetime():
     dt = iso8601.extract("urn:ngsi-ld:WeatherObserved:Spain-WeatherObserved-Valladolid-2016-11-30T07:00:00Z")
     assert dt == datetime(2016, 11, 30, 7, 0, tzinfo=UTC)
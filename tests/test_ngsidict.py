@@ -9,14 +9,19 @@
 #
 # Author: Fabien BATTELLO <fabien.battello@orange.com> et al.
 
+import json
 import pytest
 
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
 from datetime import datetime, date, time
+from decimal import Decimal
 from dateutil.tz import UTC
 from geojson import Point
 
 from ngsildclient.model.entity import Entity, mkprop
 from ngsildclient.model.ngsidict import NgsiDict
+from ngsildclient.model.exceptions import NgsiUnmatchedAttributeTypeError
 
 
 def test_type():
@@ -139,3 +144,66 @@ def test_temporal_prop_time_str():
 def test_temporal_prop_str_bad_format():
     with pytest.raises(ValueError):
         p = NgsiDict.mktprop("25:00:00Z")
+
+
+def test_plain_and_nested_paths():
+    d = NgsiDict({"fillingLevel": {"type": "Property", "value": 0.6}, "tags": ["a", "b"]})
+    assert d["fillingLevel"].type == "Property"
+    assert d["fillingLevel->value"] == 0.6
+    assert d["tags[1]"] == "b"
+    d["fillingLevel->value"] = 0.7
+    d["status"] = "ok"
+    assert d.data["fillingLevel"]["value"] == 0.7 and d.data["status"] == "ok"
+    assert "status" in d and "fillingLevel->value" in d and "missing" not in d
+    assert d.get("missing") is None and d.get("fillingLevel->missing", 0) == 0
+    with pytest.raises(KeyError):
+        d["missing"]
+
+
+def test_prop_with_meta_userdata_ngsidict():
+    p = NgsiDict.mkprop(22, userdata=NgsiDict({"accuracy": 0.95}))
+    assert p == {"accuracy": 0.95, "type": "Property", "value": 22}
+
+
+def test_to_json():
+    e = Entity("Room", "room1")
+    e.prop("temperature", 22.5, unitcode="CEL").prop("name", "Bösebrücke")
+    for indent in (None, 2, 4):
+        assert json.loads(e.to_json(indent=indent)) == e.to_dict()
+    assert "Bösebrücke" in e.to_json()
+    assert json.loads(e.to_json(pattern="TEMP")) == {"temperature": {"type": "Property", "value": 22.5, "unitCode": "CEL"}}
+
+
+def test_prop_value_types():
+    assert NgsiDict.mkprop(True) == {"type": "Property", "value": True}
+    assert NgsiDict.mkprop(OrderedDict(a=1)) == {"type": "Property", "value": {"a": 1}}
+    with pytest.raises(NgsiUnmatchedAttributeTypeError):
+        NgsiDict.mkprop({1, 2})
+
+
+def test_ngsidict_is_a_mapping():
+    p = NgsiDict.mkprop(22)
+    assert isinstance(p, MutableMapping) and isinstance(p, Mapping)
+    assert dict(p.items()) == {"type": "Property", "value": 22}
+
+
+def test_to_json_non_json_value():
+    e = Entity("Room", "room1")
+    e.root.data["price"] = Decimal("1.5")
+    assert json.loads(e.to_json())["price"] == "1.5"
+
+
+def test_dumps_orjson_matches_json():
+    pytest.importorskip("orjson")
+    from ngsildclient.model.ngsidict import _dumps, _json_default
+
+    obj = {"keys": {1: "a"}, "big": 2**70, "at": datetime(2022, 1, 1, 12, tzinfo=UTC)}
+    for indent in (None, 2):
+        assert json.loads(_dumps(obj, indent, default=_json_default)) == json.loads(
+            json.dumps(obj, default=_json_default)
+        )
+    e = Entity("Room", "room1").prop("m", {1: "a"}).prop("big", 2**70)
+    assert json.loads(e.to_json())["m"]["value"] == {"1": "a"}
+    assert json.loads(e.to_json())["big"]["value"] == 2**70
+    # documented difference: orjson writes NaN as null
+    assert json.loads(_dumps({"nan": float("nan")}, default=_json_default)) == {"nan": None}
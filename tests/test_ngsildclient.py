@@ -9,8 +9,16 @@
 #
 # Author: Fabien BATTELLO <fabien.battello@orange.com> et al.
 
+import subprocess
+import sys
+
 from ngsildclient import __version__
 
 
 def test_version():
     assert __version__ == "0.5.2"
+
+
+def test_import_leaves_logging_unconfigured():
+    code = "import logging, ngsildclient; assert not logging.getLogger().handlers"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0